@@ -373,7 +373,7 @@ class MemoryService:
                     graph_result = None
                     if GRAPH_SYNC_ENABLED:
                         try:
-                            # Use context manager to release DB lock after sync
+                            # Connection is shared process-wide and stays open
                             with GraphSync() as graph_sync:
                                 # Find similar memories for provenance
                                 similar_memories = []
@@ -394,7 +394,6 @@ class MemoryService:
                                     created_at=memory.created_at_iso,
                                     similar_memories=similar_memories
                                 )
-                            # Lock released here after context manager exits
                             logger.debug(f"Graph sync result: {graph_result}")
                         except Exception as e:
                             logger.warning(f"Graph sync failed (non-fatal): {e}")
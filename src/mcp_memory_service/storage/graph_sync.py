@@ -7,15 +7,41 @@ Syncs memories to Kuzu graph and detects provenance relationships:
 - CONTRADICTS: Conflicting information detected
 """
 
+import atexit
 import kuzu
 import os
-import re
 import logging
-from typing import Optional, List, Tuple
+import time
+from collections import OrderedDict
+from heapq import nlargest
+from operator import itemgetter
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# kuzu's get_as_df() needs pandas, which is not one of our declared
+# dependencies - fall back to the row loop when it is missing.
+try:
+    import pandas  # noqa: F401
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
+
+
+def _fetch_rows(result) -> List[tuple]:
+    """Fetch all rows from a query result, preferring the columnar path.
+
+    With pandas installed this is a single batch transfer; without it we
+    fall back to one get_next() call per row.
+    """
+    if _HAS_PANDAS:
+        return list(result.get_as_df().itertuples(index=False, name=None))
+    rows = []
+    while result.has_next():
+        rows.append(tuple(result.get_next()))
+    return rows
+
 # Graph database path
 GRAPH_DB_PATH = os.path.expanduser("~/.local/share/mcp-memory/memory_graph")
 
@@ -24,14 +50,154 @@ RELATES_TO_THRESHOLD = 0.75  # Similarity score for RELATES_TO
 SUPERSEDES_THRESHOLD = 0.90  # Very high similarity = likely supersedes
 MAX_RELATIONS_PER_MEMORY = 5  # Don't create too many edges
 
+# With auto_checkpoint disabled, checkpoint explicitly after this many
+# write transactions instead of after every commit.
+CHECKPOINT_EVERY_N_WRITES = 100
+
+# Bound on the per-database cache of hashes known to exist in the graph
+KNOWN_HASH_CACHE_SIZE = 100_000
+
+# Process-wide database handles, keyed by path. Opening a Kuzu database is
+# expensive (file mapping, catalog load, WAL replay), so the handle is kept
+# open for the life of the process rather than per GraphSync instance.
+_connections: Dict[str, Tuple[kuzu.Database, kuzu.Connection]] = {}
+_write_counts: Dict[str, int] = {}
+
+# LRU of hashes already present in each graph (OrderedDict used as an
+# ordered set). Lets sync skip MERGE work for nodes we know exist.
+_known_hashes: Dict[str, OrderedDict] = {}
+
+
+def _release_connections():
+    """Drop shared database handles at interpreter shutdown."""
+    _connections.clear()
+    _write_counts.clear()
+    _known_hashes.clear()
+
+
+atexit.register(_release_connections)
+
+# Statically-defined Cypher queries. Values are bound via Kuzu's parameter
+# binder ($name placeholders), never interpolated into the query text, so
+# Kuzu can reuse its cached prepared plan and no sanitization is needed.
+# Schema bootstrap, run once per database open. hash is the PRIMARY KEY so
+# every MERGE / MATCH-by-hash in this module resolves through the
+# primary-key hash index instead of a full node-table scan.
+_SCHEMA_DDL = (
+    """CREATE NODE TABLE IF NOT EXISTS Memory(
+        hash STRING,
+        content_preview STRING,
+        created_at STRING,
+        memory_type STRING,
+        PRIMARY KEY(hash)
+    )""",
+    # Edge timestamps are INT64 unix millis (8 bytes) rather than ISO
+    # strings (~25 bytes): smaller properties, less scan bandwidth, and no
+    # string formatting on the write path.
+    "CREATE REL TABLE IF NOT EXISTS RELATES_TO(FROM Memory TO Memory, strength DOUBLE, created_at INT64)",
+    "CREATE REL TABLE IF NOT EXISTS SUPERSEDES(FROM Memory TO Memory, reason STRING, created_at INT64)",
+    "CREATE REL TABLE IF NOT EXISTS CONTRADICTS(FROM Memory TO Memory, detected_at INT64, resolution STRING)",
+    "CREATE REL TABLE IF NOT EXISTS CAUSED_BY(FROM Memory TO Memory, created_at INT64)",
+    "CREATE REL TABLE IF NOT EXISTS DERIVED_FROM(FROM Memory TO Memory, created_at INT64)",
+)
+
+
+def _now_millis() -> int:
+    """Current time as unix epoch milliseconds (edge timestamp format)."""
+    return int(time.time() * 1000)
+
+# MERGE keys on the hash so create-if-absent is a single round-trip. The
+# OPTIONAL MATCH probe runs in the same statement (both it and the MERGE
+# are PK index lookups) and tells us reliably whether the node existed
+# before this call - property comparisons can't, since a re-sync passes
+# the same created_at the existing node already carries.
+_Q_MERGE_NODE = """
+    OPTIONAL MATCH (e:Memory {hash: $h})
+    WITH count(e) AS existed
+    MERGE (m:Memory {hash: $h})
+    ON CREATE SET m.content_preview = $p,
+                  m.created_at = $c,
+                  m.memory_type = $t
+    RETURN existed = 0 AS created
+"""
+
+_Q_ADD_RELATES_TO = """
+    MATCH (a:Memory {hash: $from_h}), (b:Memory {hash: $to_h})
+    CREATE (a)-[:RELATES_TO {strength: $s, created_at: $c}]->(b)
+"""
+
+_Q_ADD_SUPERSEDES = """
+    MATCH (new:Memory {hash: $new_h}), (old:Memory {hash: $old_h})
+    CREATE (new)-[:SUPERSEDES {reason: $r, created_at: $c}]->(old)
+"""
+
+_Q_ADD_CONTRADICTS = """
+    MATCH (a:Memory {hash: $a_h}), (b:Memory {hash: $b_h})
+    CREATE (a)-[:CONTRADICTS {detected_at: $d, resolution: $r}]->(b)
+"""
+
+# Batched variants used by sync_with_provenance: one UNWIND statement per
+# edge type replaces a round-trip per edge.
+_Q_MERGE_STUBS = """
+    UNWIND $hashes AS h
+    MERGE (m:Memory {hash: h})
+    ON CREATE SET m.content_preview = '(stub - created for edge)',
+                  m.created_at = $now,
+                  m.memory_type = 'stub'
+"""
+
+_Q_BATCH_RELATES_TO = """
+    UNWIND $rows AS r
+    MATCH (a:Memory {hash: r.from_h}), (b:Memory {hash: r.to_h})
+    CREATE (a)-[:RELATES_TO {strength: r.s, created_at: r.c}]->(b)
+"""
+
+_Q_BATCH_SUPERSEDES = """
+    UNWIND $rows AS r
+    MATCH (new:Memory {hash: r.from_h}), (old:Memory {hash: r.to_h})
+    CREATE (new)-[:SUPERSEDES {reason: r.reason, created_at: r.c}]->(old)
+"""
+
+# All graph statistics in one statement so Kuzu parses/plans once and the
+# result comes back as a single columnar batch. A UNION ALL branch whose
+# MATCH finds nothing yields no row (unlike a standalone count query), so
+# get_stats backfills missing keys with 0.
+_STAT_KEYS = (
+    "nodes",
+    "edges_relates_to",
+    "edges_supersedes",
+    "edges_contradicts",
+    "edges_caused_by",
+    "edges_derived_from",
+)
+
+_Q_STATS = """
+    MATCH (m:Memory) RETURN 'nodes' AS k, count(m) AS v
+    UNION ALL
+    MATCH ()-[r:RELATES_TO]->() RETURN 'edges_relates_to' AS k, count(r) AS v
+    UNION ALL
+    MATCH ()-[r:SUPERSEDES]->() RETURN 'edges_supersedes' AS k, count(r) AS v
+    UNION ALL
+    MATCH ()-[r:CONTRADICTS]->() RETURN 'edges_contradicts' AS k, count(r) AS v
+    UNION ALL
+    MATCH ()-[r:CAUSED_BY]->() RETURN 'edges_caused_by' AS k, count(r) AS v
+    UNION ALL
+    MATCH ()-[r:DERIVED_FROM]->() RETURN 'edges_derived_from' AS k, count(r) AS v
+"""
+
 
 class GraphSync:
     """Handles syncing memories to Kuzu graph with provenance detection.
 
-    Supports context manager pattern to automatically release DB lock:
+    Supports context manager pattern:
         with GraphSync() as gs:
             gs.sync_with_provenance(...)
-        # Lock released automatically
+
+    The underlying database handle is shared process-wide and stays open
+    across instances - exiting the context manager does NOT close it.
+    Cold-opening a Kuzu database (catalog load, mmap, WAL replay) is far
+    more expensive than holding it, so the handle is only released at
+    interpreter shutdown (or explicitly via close()).
     """
 
     def __init__(self, db_path: str = GRAPH_DB_PATH):
@@ -44,45 +210,147 @@ class GraphSync:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - release the database lock."""
-        self.close()
+        """Context manager exit - keep the shared connection open."""
         return False  # Don't suppress exceptions
 
     @property
     def conn(self) -> kuzu.Connection:
-        """Lazy connection to Kuzu database."""
+        """Lazy connection to the shared Kuzu database handle."""
         if self._conn is None:
-            self._db = kuzu.Database(self.db_path)
-            self._conn = kuzu.Connection(self._db)
+            cached = _connections.get(self.db_path)
+            if cached is None:
+                # auto_checkpoint off: checkpointing after every commit
+                # dominates write latency; see maybe_checkpoint().
+                db = kuzu.Database(self.db_path, auto_checkpoint=False)
+                conn = kuzu.Connection(db)
+                self._init_schema(conn)
+                cached = (db, conn)
+                _connections[self.db_path] = cached
+                self._db, self._conn = cached
+                # One-time sanity check per open: warns if MATCH-by-hash
+                # would fall back to scanning the node table
+                self.verify_hash_index()
+            else:
+                self._db, self._conn = cached
         return self._conn
 
     def close(self):
-        """Close database connection and release lock."""
-        if self._conn:
-            self._conn = None
-        if self._db:
-            self._db = None
-    
-    def _sanitize_string(self, s: str, max_len: int = 200) -> str:
-        """Sanitize string for Cypher query."""
-        if not s:
-            return ""
-        # Truncate and remove problematic chars
-        s = s[:max_len]
-        s = re.sub(r'[\'\"\\`]', '', s)
-        s = re.sub(r'[\x00-\x1f]', ' ', s)
-        return s
-    
-    def node_exists(self, content_hash: str) -> bool:
-        """Check if memory node already exists."""
+        """Release the shared database handle (normally only at shutdown/tests)."""
+        self._conn = None
+        self._db = None
+        _connections.pop(self.db_path, None)
+        _write_counts.pop(self.db_path, None)
+        _known_hashes.pop(self.db_path, None)
+
+    @staticmethod
+    def _init_schema(conn: kuzu.Connection):
+        """Create node/rel tables if needed, migrating legacy edge schemas."""
+        GraphSync._migrate_legacy_edges(conn)
+        for ddl in _SCHEMA_DDL:
+            try:
+                conn.execute(ddl)
+            except Exception as e:
+                logger.debug(f"Schema DDL skipped: {e}")
+
+    # Rel table -> STRING timestamp column carried by the pre-INT64 schema
+    _LEGACY_TIMESTAMP_COLUMNS = (
+        ("RELATES_TO", "created_at"),
+        ("SUPERSEDES", "created_at"),
+        ("CONTRADICTS", "detected_at"),
+        ("CAUSED_BY", "created_at"),
+        ("DERIVED_FROM", "created_at"),
+    )
+
+    @staticmethod
+    def _migrate_legacy_edges(conn: kuzu.Connection):
+        """Convert STRING edge timestamps (pre-INT64 schema) to INT64 columns.
+
+        Databases written before the INT64 switch have created_at/detected_at
+        STRING columns on their rel tables; binding epoch millis into those
+        fails on every edge write. Each affected column is retyped in place
+        via ALTER TABLE DROP + ADD, which preserves the existing edges -
+        only their old timestamps are lost (the retyped column reads NULL
+        for legacy rows).
+        """
+        try:
+            result = conn.execute("CALL table_info('RELATES_TO') RETURN *")
+        except Exception:
+            # Table doesn't exist yet - fresh database, nothing to migrate
+            return
+        try:
+            legacy = False
+            while result.has_next():
+                cells = [str(c) for c in result.get_next()]
+                if "created_at" in cells and any("STRING" in c.upper() for c in cells):
+                    legacy = True
+                    break
+            if not legacy:
+                return
+            logger.info(
+                "Migrating graph rel tables to INT64 timestamps; "
+                "existing edges are kept, their old timestamps read as NULL"
+            )
+            for table, column in GraphSync._LEGACY_TIMESTAMP_COLUMNS:
+                try:
+                    conn.execute(f"ALTER TABLE {table} DROP {column}")
+                    conn.execute(f"ALTER TABLE {table} ADD {column} INT64")
+                except Exception as e:
+                    # Tables absent from older databases are created with the
+                    # INT64 schema by _SCHEMA_DDL
+                    logger.debug(f"Timestamp migration skipped for {table}: {e}")
+            # Persist the retyped catalog before any further writes: with
+            # auto_checkpoint off, Kuzu 0.11 crashes checkpointing a session
+            # that mixed ALTERs on a reopened database with later commits
+            conn.execute("CHECKPOINT")
+        except Exception as e:
+            logger.warning(f"Legacy edge schema migration failed: {e}")
+
+    def verify_hash_index(self) -> bool:
+        """Self-test that MATCH-by-hash compiles to a PK index lookup, not a scan."""
         try:
             result = self.conn.execute(
-                f"MATCH (m:Memory {{hash: '{content_hash}'}}) RETURN m.hash"
+                "EXPLAIN MATCH (m:Memory {hash: $h}) RETURN m.hash", {"h": ""}
             )
-            return result.has_next()
+            plan = []
+            while result.has_next():
+                plan.append(str(result.get_next()))
+            plan_text = "\n".join(plan).upper()
+            # Kuzu's PK lookup operator is PRIMARY_KEY_SCAN_NODE_TABLE
+            if "PRIMARY_KEY" in plan_text or "INDEX_SCAN" in plan_text:
+                return True
+            logger.warning("MATCH-by-hash is not using the primary-key index; graph writes will scan")
+            return False
         except Exception as e:
-            logger.error(f"Error checking node existence: {e}")
+            logger.error(f"Error verifying hash index: {e}")
             return False
+
+    def _is_known(self, content_hash: str) -> bool:
+        """Check the in-process cache of hashes known to be in the graph."""
+        cache = _known_hashes.get(self.db_path)
+        if cache is not None and content_hash in cache:
+            cache.move_to_end(content_hash)
+            return True
+        return False
+
+    def _mark_known(self, *hashes: str):
+        """Record hashes as present in the graph, evicting oldest past the bound."""
+        cache = _known_hashes.setdefault(self.db_path, OrderedDict())
+        for h in hashes:
+            cache[h] = None
+            cache.move_to_end(h)
+        while len(cache) > KNOWN_HASH_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def maybe_checkpoint(self):
+        """Checkpoint the database every CHECKPOINT_EVERY_N_WRITES write transactions."""
+        count = _write_counts.get(self.db_path, 0) + 1
+        if count >= CHECKPOINT_EVERY_N_WRITES:
+            count = 0
+            try:
+                self.conn.execute("CHECKPOINT")
+            except Exception as e:
+                logger.warning(f"Graph checkpoint failed: {e}")
+        _write_counts[self.db_path] = count
     
     def add_memory_node(
         self,
@@ -91,111 +359,78 @@ class GraphSync:
         memory_type: Optional[str] = None,
         created_at: Optional[str] = None
     ) -> bool:
-        """Add a memory node to the graph."""
-        if self.node_exists(content_hash):
-            logger.debug(f"Node {content_hash[:16]}... already exists")
+        """Add a memory node to the graph (no-op if it already exists).
+
+        Engine errors propagate to the caller so a surrounding transaction
+        can roll back the whole batch.
+        """
+        if self._is_known(content_hash):
+            logger.debug(f"Node {content_hash[:16]}... already exists (cached)")
             return False
-        
-        try:
-            preview = self._sanitize_string(content, 200)
-            mem_type = self._sanitize_string(memory_type or "unknown", 50)
-            created = created_at or datetime.now().isoformat()
-            
-            self.conn.execute(f"""
-                CREATE (m:Memory {{
-                    hash: '{content_hash}',
-                    content_preview: '{preview}',
-                    created_at: '{created}',
-                    memory_type: '{mem_type}'
-                }})
-            """)
+        result = self.conn.execute(_Q_MERGE_NODE, {
+            "h": content_hash,
+            "p": content[:200] if content else "",
+            "c": created_at or datetime.now().isoformat(),
+            "t": (memory_type or "unknown")[:50]
+        })
+        created = bool(result.get_next()[0]) if result.has_next() else False
+        self._mark_known(content_hash)
+        if created:
             logger.info(f"Added memory node: {content_hash[:16]}...")
-            return True
-        except Exception as e:
-            logger.error(f"Error adding memory node: {e}")
-            return False
-    
+        else:
+            logger.debug(f"Node {content_hash[:16]}... already exists")
+        return created
+
     def add_relates_to(
         self,
         from_hash: str,
         to_hash: str,
         strength: float,
-        created_at: Optional[str] = None
+        created_at: Optional[int] = None
     ) -> bool:
-        """Create RELATES_TO edge between memories."""
-        try:
-            created = created_at or datetime.now().isoformat()
-            self.conn.execute(f"""
-                MATCH (a:Memory {{hash: '{from_hash}'}}), (b:Memory {{hash: '{to_hash}'}})
-                CREATE (a)-[:RELATES_TO {{strength: {strength}, created_at: '{created}'}}]->(b)
-            """)
-            logger.debug(f"Created RELATES_TO: {from_hash[:8]}... -> {to_hash[:8]}...")
-            return True
-        except Exception as e:
-            logger.error(f"Error creating RELATES_TO edge: {e}")
-            return False
-    
+        """Create RELATES_TO edge between memories. Engine errors propagate."""
+        self.conn.execute(_Q_ADD_RELATES_TO, {
+            "from_h": from_hash,
+            "to_h": to_hash,
+            "s": strength,
+            "c": created_at or _now_millis()
+        })
+        logger.debug(f"Created RELATES_TO: {from_hash[:8]}... -> {to_hash[:8]}...")
+        return True
+
     def add_supersedes(
         self,
         new_hash: str,
         old_hash: str,
         reason: str = "Updated information",
-        created_at: Optional[str] = None
+        created_at: Optional[int] = None
     ) -> bool:
-        """Create SUPERSEDES edge (new memory replaces old)."""
-        try:
-            created = created_at or datetime.now().isoformat()
-            reason_safe = self._sanitize_string(reason, 100)
-            self.conn.execute(f"""
-                MATCH (new:Memory {{hash: '{new_hash}'}}), (old:Memory {{hash: '{old_hash}'}})
-                CREATE (new)-[:SUPERSEDES {{reason: '{reason_safe}', created_at: '{created}'}}]->(old)
-            """)
-            logger.info(f"Created SUPERSEDES: {new_hash[:8]}... -> {old_hash[:8]}...")
-            return True
-        except Exception as e:
-            logger.error(f"Error creating SUPERSEDES edge: {e}")
-            return False
-    
+        """Create SUPERSEDES edge (new memory replaces old). Engine errors propagate."""
+        self.conn.execute(_Q_ADD_SUPERSEDES, {
+            "new_h": new_hash,
+            "old_h": old_hash,
+            "r": reason[:100],
+            "c": created_at or _now_millis()
+        })
+        logger.info(f"Created SUPERSEDES: {new_hash[:8]}... -> {old_hash[:8]}...")
+        return True
+
     def add_contradicts(
         self,
         hash_a: str,
         hash_b: str,
         resolution: str = "unresolved",
-        detected_at: Optional[str] = None
+        detected_at: Optional[int] = None
     ) -> bool:
-        """Create CONTRADICTS edge between conflicting memories."""
-        try:
-            detected = detected_at or datetime.now().isoformat()
-            resolution_safe = self._sanitize_string(resolution, 100)
-            self.conn.execute(f"""
-                MATCH (a:Memory {{hash: '{hash_a}'}}), (b:Memory {{hash: '{hash_b}'}})
-                CREATE (a)-[:CONTRADICTS {{detected_at: '{detected}', resolution: '{resolution_safe}'}}]->(b)
-            """)
-            logger.info(f"Created CONTRADICTS: {hash_a[:8]}... <-> {hash_b[:8]}...")
-            return True
-        except Exception as e:
-            logger.error(f"Error creating CONTRADICTS edge: {e}")
-            return False
-    
-    def ensure_node_exists(self, content_hash: str) -> bool:
-        """Ensure a node exists in the graph (create stub if missing)."""
-        if self.node_exists(content_hash):
-            return True
-        try:
-            # Create a stub node - will be updated if memory is stored later
-            self.conn.execute(f"""
-                CREATE (m:Memory {{
-                    hash: '{content_hash}',
-                    content_preview: '(stub - created for edge)',
-                    created_at: '{datetime.now().isoformat()}',
-                    memory_type: 'stub'
-                }})
-            """)
-            logger.debug(f"Created stub node for {content_hash[:16]}...")
-            return True
-        except Exception as e:
-            logger.error(f"Error creating stub node: {e}")
-            return False
+        """Create CONTRADICTS edge between conflicting memories. Engine errors propagate."""
+        self.conn.execute(_Q_ADD_CONTRADICTS, {
+            "a_h": hash_a,
+            "b_h": hash_b,
+            "d": detected_at or _now_millis(),
+            "r": resolution[:100]
+        })
+        logger.info(f"Created CONTRADICTS: {hash_a[:8]}... <-> {hash_b[:8]}...")
+        return True
 
     def sync_with_provenance(
         self,
@@ -225,31 +460,90 @@ class GraphSync:
             "contradicts": []
         }
 
-        # Add the node
-        result["node_created"] = self.add_memory_node(
-            content_hash, content, memory_type, created_at
-        )
-
-        if not result["node_created"]:
-            return result
+        # Node properties carry ISO timestamps, edge properties epoch millis
+        now_dt = datetime.now()
+        now = now_dt.isoformat()
+        now_ms = int(now_dt.timestamp() * 1000)
 
-        # Process similar memories for provenance
-        for related_hash, similarity in similar_memories[:MAX_RELATIONS_PER_MEMORY]:
+        # Bucket the top-k most similar memories into edge batches up front.
+        # nlargest keeps the strongest candidates even when the caller hands
+        # over an unsorted list (O(n log k) vs sorting the whole thing).
+        top_similar = nlargest(
+            MAX_RELATIONS_PER_MEMORY, similar_memories, key=itemgetter(1)
+        )
+        stub_hashes = []
+        relates_rows = []
+        supersedes_rows = []
+        for related_hash, similarity in top_similar:
             if related_hash == content_hash:
                 continue
-
-            # Ensure target node exists (create stub if not)
-            self.ensure_node_exists(related_hash)
-
+            # Similar memories usually come from vector search over already
+            # graphed content - skip the MERGE for hashes we know exist.
+            if not self._is_known(related_hash):
+                stub_hashes.append(related_hash)
             if similarity >= SUPERSEDES_THRESHOLD:
                 # Very high similarity - this likely supersedes the old one
-                if self.add_supersedes(content_hash, related_hash, "High similarity update"):
-                    result["supersedes"].append(related_hash)
+                supersedes_rows.append({
+                    "from_h": content_hash, "to_h": related_hash,
+                    "reason": "High similarity update", "c": now_ms
+                })
             elif similarity >= RELATES_TO_THRESHOLD:
                 # Moderate similarity - related content
-                if self.add_relates_to(content_hash, related_hash, similarity):
-                    result["relates_to"].append(related_hash)
-        
+                relates_rows.append({
+                    "from_h": content_hash, "to_h": related_hash,
+                    "s": similarity, "c": now_ms
+                })
+
+        # Run the whole sync as one transaction: node + stubs + edges commit
+        # (and fsync) together instead of once per statement.
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+
+            result["node_created"] = self.add_memory_node(
+                content_hash, content, memory_type, created_at or now
+            )
+
+            if result["node_created"]:
+                if stub_hashes:
+                    # Ensure target nodes exist (create stubs if not)
+                    self.conn.execute(_Q_MERGE_STUBS, {"hashes": stub_hashes, "now": now})
+                if relates_rows:
+                    self.conn.execute(_Q_BATCH_RELATES_TO, {"rows": relates_rows})
+                    result["relates_to"] = [r["to_h"] for r in relates_rows]
+                if supersedes_rows:
+                    self.conn.execute(_Q_BATCH_SUPERSEDES, {"rows": supersedes_rows})
+                    result["supersedes"] = [r["to_h"] for r in supersedes_rows]
+
+            self.conn.execute("COMMIT")
+            if stub_hashes:
+                self._mark_known(*stub_hashes)
+            self.maybe_checkpoint()
+        except Exception as e:
+            logger.error(
+                f"Error syncing {content_hash[:16]}... to graph "
+                f"({len(stub_hashes)} stubs, {len(relates_rows)} relates_to, "
+                f"{len(supersedes_rows)} supersedes): {e}"
+            )
+            try:
+                self.conn.execute("ROLLBACK")
+            except Exception:
+                pass
+            # The node create was rolled back too - don't leave it cached
+            cache = _known_hashes.get(self.db_path)
+            if cache is not None:
+                cache.pop(content_hash, None)
+            # Everything above was rolled back - report none of it
+            return {
+                "node_created": False,
+                "relates_to": [],
+                "supersedes": [],
+                "contradicts": [],
+                "error": str(e)
+            }
+
+        if not result["node_created"]:
+            return result
+
         logger.info(
             f"Synced {content_hash[:16]}... - "
             f"relates_to: {len(result['relates_to'])}, "
@@ -261,22 +555,25 @@ class GraphSync:
     def get_provenance_chain(self, content_hash: str, depth: int = 3) -> List[dict]:
         """Get the provenance chain for a memory (what it supersedes/relates to)."""
         try:
+            # Path length bounds cannot be bound as parameters, so only the
+            # depth (an int) is interpolated; the hash goes through the binder.
+            # Kuzu has no type() function for recursive rels - return the
+            # path's rel list and read the final hop's label client-side.
             result = self.conn.execute(f"""
-                MATCH path = (m:Memory {{hash: '{content_hash}'}})-[r:SUPERSEDES|RELATES_TO*1..{depth}]->(related:Memory)
-                RETURN related.hash, related.content_preview, type(r), length(path)
+                MATCH path = (m:Memory {{hash: $h}})-[r:SUPERSEDES|RELATES_TO*1..{int(depth)}]->(related:Memory)
+                RETURN related.hash, related.content_preview, rels(path), length(path)
                 ORDER BY length(path)
-            """)
-            
-            chain = []
-            while result.has_next():
-                row = result.get_next()
-                chain.append({
+            """, {"h": content_hash})
+
+            return [
+                {
                     "hash": row[0],
                     "preview": row[1],
-                    "relationship": row[2],
+                    "relationship": row[2][-1]["_label"] if row[2] else None,
                     "depth": row[3]
-                })
-            return chain
+                }
+                for row in _fetch_rows(result)
+            ]
         except Exception as e:
             logger.error(f"Error getting provenance chain: {e}")
             return []
@@ -285,18 +582,15 @@ class GraphSync:
         """Get graph statistics."""
         try:
             stats = {}
-            
-            # Node count
-            result = self.conn.execute("MATCH (m:Memory) RETURN count(m)")
-            stats["nodes"] = result.get_next()[0]
-            
-            # Edge counts by type
-            for edge_type in ["RELATES_TO", "SUPERSEDES", "CONTRADICTS", "CAUSED_BY", "DERIVED_FROM"]:
-                result = self.conn.execute(f"MATCH ()-[r:{edge_type}]->() RETURN count(r)")
-                stats[f"edges_{edge_type.lower()}"] = result.get_next()[0]
-            
-            stats["total_edges"] = sum(v for k, v in stats.items() if k.startswith("edges_"))
-            
+            total_edges = 0
+            for key, value in _fetch_rows(self.conn.execute(_Q_STATS)):
+                value = int(value)
+                stats[key] = value
+                if key != "nodes":
+                    total_edges += value
+            for key in _STAT_KEYS:
+                stats.setdefault(key, 0)
+            stats["total_edges"] = total_edges
             return stats
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
@@ -16,7 +16,9 @@
 Health check endpoints for the HTTP interface.
 """
 
+import asyncio
 import logging
+import re
 import time
 import platform
 import psutil
@@ -91,6 +93,49 @@ class DetailedHealthResponse(BaseModel):
 # Track startup time for uptime calculation
 _startup_time = time.time()
 
+# time.tzname/time.daylight are fixed from the environment at interpreter
+# start, so resolve the local timezone name once
+_TZ_NAME = time.tzname[0] if time.daylight == 0 else time.tzname[1]
+
+def _ttl_cached(fn, ttl: float = 1.0):
+    """Wrap a zero-arg callable with a time-based cache (default 1s TTL).
+
+    Health endpoints get polled at 1 Hz+ by liveness monitors; there is no
+    point re-running statvfs/sysinfo syscalls more often than that.
+    """
+    state = {"at": 0.0, "value": None}
+
+    def wrapper():
+        now = time.monotonic()
+        if state["value"] is None or now - state["at"] >= ttl:
+            state["value"] = fn()
+            state["at"] = now
+        return state["value"]
+
+    return wrapper
+
+
+# Dynamic system metrics, refreshed at most once per second
+_virtual_memory = _ttl_cached(psutil.virtual_memory)
+_disk_usage_root = _ttl_cached(lambda: psutil.disk_usage('/'))
+
+# Constant over the process lifetime - computed once at import
+_SYSTEM_STATIC = {
+    "platform": platform.system(),
+    "platform_version": platform.version(),
+    "python_version": platform.python_version(),
+    "cpu_count": psutil.cpu_count(),
+    "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+}
+
+# Session-start memories embed their metadata as "Key: value" lines; one
+# multi-line scan pulls out all three fields in a single pass. [ \t]*
+# rather than \s* so an empty value never swallows the following line.
+_SESSION_RE = re.compile(
+    r'^Session #(?P<num>\d+)|^Started:[ \t]*(?P<start>.+)|^Gap from previous:[ \t]*(?P<gap>.+)',
+    re.MULTILINE
+)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -107,14 +152,13 @@ async def health_check():
 async def get_current_time():
     """Get current real-world time for temporal awareness."""
     now = datetime.now()
-    tz_name = time.tzname[0] if time.daylight == 0 else time.tzname[1]
 
     return TimeResponse(
         iso=now.isoformat(),
         human=now.strftime("%A, %B %d, %Y at %I:%M:%S %p"),
         date=now.strftime("%Y-%m-%d"),
         time=now.strftime("%I:%M:%S %p"),
-        timezone=tz_name,
+        timezone=_TZ_NAME,
         unix=str(int(now.timestamp())),
         day_of_week=now.strftime("%A"),
         hour_24=now.strftime("%H:%M")
@@ -125,15 +169,15 @@ def format_elapsed_time(seconds: int) -> str:
     """Format elapsed time in human-readable format."""
     if seconds < 60:
         return f"{seconds} seconds"
-    elif seconds < 3600:
+    if seconds < 3600:
         minutes = seconds // 60
         return f"{minutes} minute{'s' if minutes != 1 else ''}"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        if minutes > 0:
-            return f"{hours} hour{'s' if hours != 1 else ''} {minutes} min"
-        return f"{hours} hour{'s' if hours != 1 else ''}"
+    hours, remainder = divmod(seconds, 3600)
+    minutes = remainder // 60
+    suffix = 's' if hours != 1 else ''
+    if minutes > 0:
+        return f"{hours} hour{suffix} {minutes} min"
+    return f"{hours} hour{suffix}"
 
 
 @router.get("/session", response_model=SessionResponse)
@@ -155,9 +199,8 @@ async def get_current_session(
         )
 
         if results and len(results) > 0:
-            # Sort by created_at descending and take the most recent
-            sorted_results = sorted(results, key=lambda x: x.created_at if hasattr(x, 'created_at') else 0, reverse=True)
-            session_memory = sorted_results[0]
+            # Take the most recent by created_at (O(n), no sorted copy)
+            session_memory = max(results, key=lambda x: getattr(x, 'created_at', 0))
 
             # Handle both dict and Memory object formats
             content = session_memory.content if hasattr(session_memory, 'content') else session_memory.get('content', '')
@@ -167,16 +210,13 @@ async def get_current_session(
             session_start = None
             gap_from_previous = None
 
-            for line in content.split('\n'):
-                if line.startswith('Session #'):
-                    try:
-                        session_number = int(line.replace('Session #', '').strip())
-                    except ValueError:
-                        pass
-                elif line.startswith('Started:'):
-                    session_start = line.replace('Started:', '').strip()
-                elif line.startswith('Gap from previous:'):
-                    gap_from_previous = line.replace('Gap from previous:', '').strip()
+            for match in _SESSION_RE.finditer(content):
+                if match.group('num'):
+                    session_number = int(match.group('num'))
+                elif match.group('start'):
+                    session_start = match.group('start').strip()
+                elif match.group('gap'):
+                    gap_from_previous = match.group('gap').strip()
 
             # Calculate elapsed time (using UTC for comparison)
             elapsed_seconds = 0
@@ -223,17 +263,27 @@ async def detailed_health_check(
     user: AuthenticationResult = Depends(require_read_access) if OAUTH_ENABLED else None
 ):
     """Detailed health check with system and storage information."""
-    
-    # Get system information
-    memory_info = psutil.virtual_memory()
-    disk_info = psutil.disk_usage('/')
-    
+
+    # Kick storage I/O off first so it overlaps the CPU-only system-info
+    # gathering below; for network backends (Cloudflare) get_stats is a
+    # full RTT and dominates this endpoint's latency.
+    stats_task = None
+    if hasattr(storage, 'get_stats') and callable(getattr(storage, 'get_stats')):
+        stats_task = asyncio.create_task(storage.get_stats())
+    sync_task = (
+        asyncio.create_task(storage.get_sync_status())
+        if hasattr(storage, 'get_sync_status') else None
+    )
+
+    now_ts = time.time()
+    uptime_seconds = now_ts - _startup_time
+
+    # Get system information (static pieces precomputed, dynamic cached)
+    memory_info = _virtual_memory()
+    disk_info = _disk_usage_root()
+
     system_info = {
-        "platform": platform.system(),
-        "platform_version": platform.version(),
-        "python_version": platform.python_version(),
-        "cpu_count": psutil.cpu_count(),
-        "memory_total_gb": round(memory_info.total / (1024**3), 2),
+        **_SYSTEM_STATIC,
         "memory_available_gb": round(memory_info.available / (1024**3), 2),
         "memory_percent": memory_info.percent,
         "disk_total_gb": round(disk_info.total / (1024**3), 2),
@@ -244,9 +294,9 @@ async def detailed_health_check(
     # Get storage information (support all storage backends)
     try:
         # Get statistics from storage using universal get_stats() method
-        if hasattr(storage, 'get_stats') and callable(getattr(storage, 'get_stats')):
+        if stats_task is not None:
             # All storage backends now have async get_stats()
-            stats = await storage.get_stats()
+            stats = await stats_task
         else:
             stats = {"error": "Storage backend doesn't support statistics"}
 
@@ -275,16 +325,16 @@ async def detailed_health_check(
                 storage_info["embedding_model"] = storage.embedding_model_name
 
             # Add sync status for hybrid backend
-            if backend_type == "hybrid" and hasattr(storage, 'get_sync_status'):
+            if backend_type == "hybrid" and sync_task is not None:
                 try:
-                    sync_status = await storage.get_sync_status()
+                    sync_status = await sync_task
                     storage_info["sync_status"] = {
                         "is_running": sync_status.get('is_running', False),
                         "last_sync_time": sync_status.get('last_sync_time', 0),
                         "pending_operations": sync_status.get('pending_operations', 0),
                         "operations_processed": sync_status.get('operations_processed', 0),
                         "operations_failed": sync_status.get('operations_failed', 0),
-                        "time_since_last_sync": time.time() - sync_status.get('last_sync_time', 0) if sync_status.get('last_sync_time', 0) > 0 else 0
+                        "time_since_last_sync": now_ts - sync_status.get('last_sync_time', 0) if sync_status.get('last_sync_time', 0) > 0 else 0
                     }
                 except Exception as sync_err:
                     storage_info["sync_status"] = {"error": str(sync_err)}
@@ -305,11 +355,17 @@ async def detailed_health_check(
             "status": "error",
             "error": str(e)
         }
-    
+
+    # Drop the sync-status task if nothing consumed it (non-hybrid backend
+    # or an error path above)
+    if sync_task is not None and "sync_status" not in storage_info:
+        sync_task.cancel()
+
+
     # Performance metrics (basic for now)
     performance_info = {
-        "uptime_seconds": time.time() - _startup_time,
-        "uptime_formatted": format_uptime(time.time() - _startup_time)
+        "uptime_seconds": uptime_seconds,
+        "uptime_formatted": format_uptime(uptime_seconds)
     }
     
     # Extract statistics for separate field if available
@@ -324,8 +380,8 @@ async def detailed_health_check(
     return DetailedHealthResponse(
         status="healthy",
         version=__version__,
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        uptime_seconds=time.time() - _startup_time,
+        timestamp=datetime.fromtimestamp(now_ts, timezone.utc).isoformat(),
+        uptime_seconds=uptime_seconds,
         storage=storage_info,
         system=system_info,
         performance=performance_info,
@@ -360,13 +416,17 @@ async def sync_status(
         }
 
 
+# (threshold, divisor, unit) - first matching threshold wins
+_UPTIME_UNITS = (
+    (60, 1, "seconds"),
+    (3600, 60, "minutes"),
+    (86400, 3600, "hours"),
+)
+
+
 def format_uptime(seconds: float) -> str:
     """Format uptime in human-readable format."""
-    if seconds < 60:
-        return f"{seconds:.1f} seconds"
-    elif seconds < 3600:
-        return f"{seconds/60:.1f} minutes"
-    elif seconds < 86400:
-        return f"{seconds/3600:.1f} hours"
-    else:
-        return f"{seconds/86400:.1f} days"
\ No newline at end of file
+    for threshold, divisor, unit in _UPTIME_UNITS:
+        if seconds < threshold:
+            return f"{seconds / divisor:.1f} {unit}"
+    return f"{seconds / 86400:.1f} days"
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Unit tests for GraphSync (Kuzu provenance graph)."""
+
+import pytest
+
+kuzu = pytest.importorskip("kuzu")
+
+from mcp_memory_service.storage import graph_sync as graph_sync_module
+from mcp_memory_service.storage.graph_sync import GraphSync
+
+
+@pytest.fixture
+def graph_sync(tmp_path):
+    """Create a GraphSync instance backed by a fresh temporary database.
+
+    Cleanup:
+        Releases the shared connection so other tests get a cold database.
+    """
+    gs = GraphSync(db_path=str(tmp_path / "memory_graph"))
+    yield gs
+    gs.close()
+
+
+@pytest.mark.unit
+class TestGraphSync:
+    """Test graph schema bootstrap and provenance sync."""
+
+    def test_schema_bootstrap_uses_hash_index(self, graph_sync):
+        """Fresh databases get the bootstrap schema with hash as PRIMARY KEY.
+
+        Validates:
+        - Schema DDL runs on first connection
+        - EXPLAIN of a MATCH-by-hash resolves through the PK index
+        """
+        assert graph_sync.verify_hash_index() is True
+
+    def test_sync_creates_node_stubs_and_edges(self, graph_sync):
+        """A sync creates the memory node, stub targets, and provenance edges.
+
+        Validates:
+        - node_created is reported for a new memory
+        - Similarity >= SUPERSEDES_THRESHOLD produces a SUPERSEDES edge
+        - Similarity >= RELATES_TO_THRESHOLD produces a RELATES_TO edge
+        - Stub nodes are created for edge targets
+        """
+        result = graph_sync.sync_with_provenance(
+            content_hash="hash_new",
+            content="Updated deployment notes",
+            memory_type="note",
+            created_at="2026-08-26T10:00:00",
+            similar_memories=[("hash_old", 0.95), ("hash_related", 0.80)]
+        )
+
+        assert result["node_created"] is True
+        assert result["supersedes"] == ["hash_old"]
+        assert result["relates_to"] == ["hash_related"]
+
+        stats = graph_sync.get_stats()
+        assert stats["nodes"] == 3  # new memory + two stubs
+        assert stats["edges_supersedes"] == 1
+        assert stats["edges_relates_to"] == 1
+        assert stats["edges_contradicts"] == 0  # zero counts still reported
+        assert stats["total_edges"] == 2
+
+    def test_resync_after_restart_does_not_duplicate_edges(self, graph_sync):
+        """Re-syncing an already-graphed memory is a no-op, even cache-cold.
+
+        Validates:
+        - MERGE reports created=False for an existing node with the same
+          created_at (the timestamp-equality regression)
+        - No duplicate edges are written on re-sync
+        """
+        kwargs = dict(
+            content_hash="hash_new",
+            content="Updated deployment notes",
+            memory_type="note",
+            created_at="2026-08-26T10:00:00",
+            similar_memories=[("hash_old", 0.95)]
+        )
+        first = graph_sync.sync_with_provenance(**kwargs)
+        assert first["node_created"] is True
+
+        # Simulate a process restart: known-hash cache is empty
+        graph_sync_module._known_hashes.clear()
+
+        second = graph_sync.sync_with_provenance(**kwargs)
+        assert second["node_created"] is False
+        assert second["supersedes"] == []
+
+        stats = graph_sync.get_stats()
+        assert stats["edges_supersedes"] == 1
+
+    def test_get_provenance_chain(self, graph_sync):
+        """Provenance chains surface superseded/related memories.
+
+        Validates:
+        - Chain includes the direct SUPERSEDES target with its preview
+        """
+        graph_sync.sync_with_provenance(
+            content_hash="hash_new",
+            content="Updated deployment notes",
+            memory_type="note",
+            created_at="2026-08-26T10:00:00",
+            similar_memories=[("hash_old", 0.95)]
+        )
+
+        chain = graph_sync.get_provenance_chain("hash_new")
+        assert len(chain) == 1
+        assert chain[0]["hash"] == "hash_old"
+        assert chain[0]["depth"] == 1